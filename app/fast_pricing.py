@@ -0,0 +1,95 @@
+"""
+Batch pricing kernel for large or simulated orders.
+
+Prices many order lines in a single call instead of going through the
+per-product `buy` -> `apply_promotions` dispatch chain for every line.
+Promotions are identified by small integer codes so the whole computation
+is plain arithmetic over parallel sequences of prices, quantities, and
+codes.
+
+If `numba` is installed the kernel is JIT-compiled (and the compiled code
+cached on disk); otherwise it runs as regular Python. The module works
+either way — numba is not a required dependency.
+
+Promotion codes:
+    0: no promotion
+    1: second one half price
+    2: third one free
+    3: percentage discount (uses the parallel `percents` sequence)
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the kernel as plain Python
+
+    def njit(*decorator_args, **decorator_kwargs):
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+PROMO_NONE = 0
+PROMO_SECOND_HALF_PRICE = 1
+PROMO_THIRD_ONE_FREE = 2
+PROMO_PERCENT_DISCOUNT = 3
+
+
+@njit(cache=True)
+def price_batch(prices, quantities, promo_codes, percents) -> float:
+    """Computes the total price of a batch of order lines.
+
+    Args:
+        prices: Unit price per order line.
+        quantities: Ordered quantity per order line.
+        promo_codes: Promotion code per order line (see module docstring).
+        percents: Discount percentage per order line
+        (only read where the code is PROMO_PERCENT_DISCOUNT).
+
+    Returns:
+        float: The total price of all order lines.
+    """
+
+    total = 0.0
+    for i in range(len(prices)):
+        price = prices[i]
+        quantity = quantities[i]
+        code = promo_codes[i]
+        if code == PROMO_SECOND_HALF_PRICE:
+            total += price * (quantity - 0.5 * (quantity // 2))
+        elif code == PROMO_THIRD_ONE_FREE:
+            total += price * (quantity - quantity // 3)
+        elif code == PROMO_PERCENT_DISCOUNT:
+            total += price * quantity * (1 - percents[i] / 100)
+        else:
+            total += price * quantity
+    return total
+
+
+@njit(cache=True)
+def order_batch(prices, stock, quantities, promo_codes, percents):
+    """Validates and prices a batch of order lines in one call.
+
+    Works like `Store.order` for flat data: every line is checked against
+    the available stock first, and only a fully valid batch is priced.
+    Stocked lines are marked with a non-negative stock figure; use a
+    negative value for non-stocked lines to skip the check.
+
+    Args:
+        prices: Unit price per order line.
+        stock: Units in stock per order line, or a negative value for
+        non-stocked lines.
+        quantities: Ordered quantity per order line.
+        promo_codes: Promotion code per order line (see module docstring).
+        percents: Discount percentage per order line
+        (only read where the code is PROMO_PERCENT_DISCOUNT).
+
+    Returns:
+        tuple: (total price, -1) on success, or (-1.0, index of the first
+        line that ordered more than its stock).
+    """
+
+    for i in range(len(quantities)):
+        if stock[i] >= 0 and quantities[i] > stock[i]:
+            return -1.0, i
+    return price_batch(prices, quantities, promo_codes, percents), -1
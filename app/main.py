@@ -59,12 +59,10 @@ def start(store_obj: Store) -> NoReturn:
         and handling orders.
     """
 
-    menu = get_menu_dict()
-    menu_numbers = [str(number) for number in menu]
     while True:
         print_menu()
         user_input = input("Please choose a number: ")
-        if user_input not in menu_numbers:
+        if user_input not in MENU_NUMBERS:
             print("Error with your choice! Try again!")
             print()
             continue
@@ -76,17 +74,12 @@ def start(store_obj: Store) -> NoReturn:
 
 
 def get_menu_dict() -> dict:
-    """Returns a dictionary mapping menu options to their descriptions and functions.
+    """Returns the dictionary mapping menu options to their descriptions
+    and functions.
 
     Returns:
         dict: The menu dictionary containing options and corresponding functions.
     """
-    MENU = {
-        1: ["List all products in store", print_all_products],
-        2: ["Show total amount in store", print_total_amount],
-        3: ["Make an order", make_order],
-        4: ["Quit", quit],
-    }
     return MENU
 
 
@@ -95,8 +88,7 @@ def print_menu() -> None:
 
     print("\tStore Menu")
     print("\t----------")
-    menu = get_menu_dict()
-    for i, item_lst in menu.items():
+    for i, item_lst in MENU.items():
         print(f"{i}. {item_lst[0]}")
 
 
@@ -109,12 +101,18 @@ def call_command(num: int, store_obj: Store):
         store_obj (Store): The store object used for executing commands.
     """
 
-    menu = get_menu_dict()
-    # num 4 = quit app
-    if num != 4:
-        return menu[num][1](store_obj)
-    else:
-        return menu[num][1]()
+    return MENU[num][1](store_obj)
+
+
+def quit_app(store_obj: Store) -> NoReturn:
+    """Exits the application.
+
+    Args:
+        store_obj (Store): Unused; present so every menu entry shares
+        the same signature.
+    """
+
+    quit()
 
 
 def print_all_products(store_obj: Store) -> None:
@@ -123,8 +121,18 @@ def print_all_products(store_obj: Store) -> None:
     Args:
         store_obj (Store): The store object containing the products.
     """
+
+    print_product_list(store_obj.get_all_products())
+
+
+def print_product_list(products: list) -> None:
+    """Displays an already fetched list of products.
+
+    Args:
+        products (list): The products to display.
+    """
+
     print("----------")
-    products = store_obj.get_all_products()
     for i, product in enumerate(products):
         print(f"{i + 1}. {product.show()}")
     print("----------")
@@ -137,8 +145,7 @@ def print_total_amount(store_obj: Store) -> None:
         store_obj (Store): The store object containing the products.
     """
 
-    products = store_obj.get_all_products()
-    quantity = sum([product.quantity for product in products])
+    quantity = store_obj.get_total_quantity()
     print(f"Total of {quantity} items in store")
 
 
@@ -151,15 +158,15 @@ def make_order(store_obj: Store) -> None:
         product information and processing the order.
     """
 
-    print_all_products(store_obj)
+    products = store_obj.get_all_products()
+    print_product_list(products)
     print()
     print("When you want to finish order, enter empty text.")
 
-    products = store_obj.get_all_products()
     order_list = []
     while True:
         product_message = "Which product # do you want? "
-        product_index = get_product_index_from_user(store_obj, product_message)
+        product_index = get_product_index_from_user(products, product_message)
 
         if product_index:
             product = products[int(product_index) - 1]
@@ -181,53 +188,45 @@ def make_order(store_obj: Store) -> None:
         print()
 
 
-def get_product_index_from_user(store_obj: Store, message: str) -> int | None:
+def get_product_index_from_user(products: list, message: str) -> int | None:
     """Prompts the user to select a product index and validates the input.
 
     Args:
-        store_obj (Store): The store object used for retrieving
-        product details.
+        products (list): The active products the user can choose from.
         message (str): The message displayed to prompt the user.
 
     Returns:
         int | None: The validated product index, or None if input is empty.
     """
 
-    products = store_obj.get_all_products()
     error = (
         f"Only numbers between 1-{len(products)} are allowed!\n"
         + "Please try again!"
     )
 
     while True:
-        num = input(message)
+        num = input(message).strip()
         if not num:
             return None
-        if num == "0":
+        # cheaper precheck than raising and catching ValueError from int();
+        # isdecimal() rejects the superscripts isdigit() lets through, and
+        # removeprefix() strips at most one leading minus sign
+        if not num.removeprefix("-").isdecimal():
+            print(error)
+            continue
+        num = int(num)
+        if num <= 0:
             print("Only positive numbers are allowed")
             continue
-        else:
-            try:
-                num = int(num)
-                if num < 0:
-                    print("Only positive numbers are allowed")
-                    continue
-
-                product = products[num - 1]
-
-                if not product.active:
-                    print(
-                        f"There are no {product.name} left. Try another product"
-                    )
-                    continue
-            except ValueError:
-                print(error)
-                continue
-            except IndexError:
-                print(error)
-                continue
-            else:
-                break
+        if num > len(products):
+            print(error)
+            continue
+
+        product = products[num - 1]
+        if not product.active:
+            print(f"There are no {product.name} left. Try another product")
+            continue
+        break
     return num
 
 
@@ -248,33 +247,39 @@ def get_quantity_from_user(
         input("You picked no product. Enter to leave!")
         return None
     while True:
-        num = input(message)
+        num = input(message).strip()
         if not num:
             return None
-        if num == "0":
+        # cheaper precheck than raising and catching ValueError from int();
+        # isdecimal() rejects the superscripts isdigit() lets through, and
+        # removeprefix() strips at most one leading minus sign
+        if not num.removeprefix("-").isdecimal():
+            print(f"Must be a positive number between 1-{product.quantity}")
+            continue
+        num = int(num)
+        if num <= 0:
             print("Only positive numbers are allowed")
             continue
-        else:
-            try:
-                num = int(num)
-            except ValueError:
-                print(
-                    f"Must be a positive number between 1-{product.quantity}"
-                )
-                continue
-            else:
-                if product.quantity < num and not isinstance(
-                    product, NonStockedProduct
-                ):
-                    print(
-                        f"There are only {product.quantity} {product.name} in stock!\n"
-                        + f"Amount cannot be higher than {product.quantity}!"
-                    )
-                    continue
-                else:
-                    break
+        if product.is_stocked and product.quantity < num:
+            print(
+                f"There are only {product.quantity} {product.name} in stock!\n"
+                + f"Amount cannot be higher than {product.quantity}!"
+            )
+            continue
+        break
     return num
 
 
+# built once at import so the interactive loop does not rebuild it
+# on every menu display and command
+MENU = {
+    1: ["List all products in store", print_all_products],
+    2: ["Show total amount in store", print_total_amount],
+    3: ["Make an order", make_order],
+    4: ["Quit", quit_app],
+}
+MENU_NUMBERS = frozenset(str(number) for number in MENU)
+
+
 if __name__ == "__main__":
     main()
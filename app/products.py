@@ -16,17 +16,33 @@ from promotions import Promotion
 
 
 class Product:
-    total_quantity = 0
+    __slots__ = (
+        "name",
+        "_price",
+        "_quantity",
+        "active",
+        "_promotion",
+        "_show_cache",
+        "_on_active_change",
+        "_on_quantity_change",
+    )
+
+    is_stocked = True
 
     def __init__(self, name: str, price: float, quantity: int) -> None:
-        if self.name_is_valid(name):
-            self.name = name
-
-        if self.price_is_valid(price):
-            self.price = price
+        if not name:
+            raise ValueError("Product name must have at least one letter!")
+        # bool is a subclass of int and must not pass as a quantity
+        if (
+            isinstance(quantity, bool)
+            or not isinstance(quantity, int)
+            or quantity < 0
+        ):
+            raise Exception("Quantity must be a positive integer")
 
-        if self.quantity_is_valid(quantity):
-            self._quantity = quantity
+        self.name = name
+        self.price = price  # validated by the price setter
+        self._quantity = quantity
 
         if self._quantity == 0:
             self.active = False
@@ -34,64 +50,42 @@ class Product:
             self.active = True
 
         self._promotion = None
-
-        Product.total_quantity += quantity
+        self._show_cache = None
+        self._on_active_change = []
+        self._on_quantity_change = []
 
     def __str__(self) -> str:
         """Returns the product name."""
         return self.name
 
-    def name_is_valid(self, name: str) -> bool:
-        """Checks if the provided name is valid.
+    def _notify_quantity_change(self, delta: int) -> None:
+        """Reports a stock change to the subscribed stores."""
 
-        Args:
-            name (str): The name of the product.
+        for callback in self._on_quantity_change:
+            callback(delta)
 
-        Returns:
-            bool: True if the name is valid; raises ValueError otherwise.
-        """
+    @property
+    def price(self) -> float:
+        """Returns the price of the product."""
 
-        if name:
-            return True
-        else:
-            raise ValueError("Product name must have at least one letter!")
+        return self._price
 
-    def price_is_valid(self, price: float) -> bool:
-        """Checks if the provided price is valid.
+    @price.setter
+    def price(self, price: float) -> None:
+        """Sets the product price after validation and refreshes
+        the cached display string.
 
         Args:
-            price (float): The price of the product.
-
-        Returns:
-            bool: True if the price is valid; raises TypeError
-            or ValueError otherwise.
+            price (float): New price of the product.
         """
 
-        test = []
-        if type(price) is float or type(price) is int:
-            test.append(True)
-        else:
+        # bool is a subclass of int and must not pass as a price
+        if isinstance(price, bool) or not isinstance(price, (int, float)):
             raise TypeError("Price must be an integer or a float!")
-        if price >= 0:
-            test.append(True)
-        else:
+        if price < 0:
             raise ValueError("Price must be 0 or positive!")
-        return all(test)
-
-    def quantity_is_valid(self, quantity: int) -> bool:
-        """Checks if the provided quantity is valid.
-
-        Args:
-            quantity (int): The quantity of the product.
-
-        Returns:
-            bool: True if the quantity is valid; raises Exception otherwise.
-        """
-
-        if type(quantity) is int and quantity >= 0:
-            return True
-        else:
-            raise Exception("Quantity must be a positive integer")
+        self._price = price
+        self._show_cache = None
 
     @property
     def quantity(self) -> int:
@@ -108,14 +102,19 @@ class Product:
             quantity (int): New quantity of the product.
         """
 
-        if self.quantity_is_valid(quantity):
-            self._quantity = quantity
-        if self._quantity == 0:
+        if (
+            isinstance(quantity, bool)
+            or not isinstance(quantity, int)
+            or quantity < 0
+        ):
+            raise Exception("Quantity must be a positive integer")
+        delta = quantity - self._quantity
+        self._quantity = quantity
+        self._show_cache = None
+        if delta:
+            self._notify_quantity_change(delta)
+        if quantity == 0:
             self.deactivate()
-        if self._quantity < 0:
-            raise ValueError(
-                f"Cannot buy more {self.name}'s than {self._quantity}"
-            )
 
     @property
     def promotion(self):
@@ -138,6 +137,7 @@ class Product:
         """
 
         self._promotion = promotion_obj
+        self._show_cache = None
 
     def is_active(self) -> bool:
         """Checks if the product is active.
@@ -149,12 +149,22 @@ class Product:
         return self.active
 
     def activate(self) -> None:
-        """Activates the product."""
-        self.active = True
+        """Activates the product and notifies its subscribed stores."""
+
+        if not self.active:
+            self.active = True
+            self._show_cache = None
+            for callback in self._on_active_change:
+                callback(self)
 
     def deactivate(self) -> None:
-        """Deactivates the product."""
-        self.active = False
+        """Deactivates the product and notifies its subscribed stores."""
+
+        if self.active:
+            self.active = False
+            self._show_cache = None
+            for callback in self._on_active_change:
+                callback(self)
 
     def show(self) -> str:
         """Returns a string describing the product with its name, price,
@@ -164,9 +174,12 @@ class Product:
             str: Description of the product.
         """
 
+        if self._show_cache is not None:
+            return self._show_cache
         text = f"{self.name}, Price: {self.price}, Quantity: {self.quantity}"
         if isinstance(self._promotion, Promotion):
             text += f", Promotion: {self.promotion}"
+        self._show_cache = text
         return text
 
     def buy(self, quantity: int) -> float:
@@ -181,13 +194,24 @@ class Product:
         """
         if isinstance(self._promotion, Promotion):
             return self._promotion.apply_promotions(self, quantity)
-        else:
-            self._quantity -= quantity
-            Product.total_quantity -= quantity
-            return self.price * quantity
+        remaining = self._quantity - quantity
+        if remaining < 0:
+            raise ValueError(
+                f"Cannot buy more {self.name}'s than {self._quantity}"
+            )
+        self._quantity = remaining
+        self._show_cache = None
+        self._notify_quantity_change(-quantity)
+        if remaining == 0:
+            self.deactivate()
+        return self.price * quantity
 
 
 class NonStockedProduct(Product):
+    __slots__ = ()
+
+    is_stocked = False
+
     def __init__(self, name: str, price: float, quantity: int = 0) -> None:
         super().__init__(name, price, quantity)
         self.activate()
@@ -216,9 +240,12 @@ class NonStockedProduct(Product):
             str: Description of the product.
         """
 
+        if self._show_cache is not None:
+            return self._show_cache
         text = f"{self.name}, Price: {self.price}"
         if isinstance(self._promotion, Promotion):
             text += f", Promotion: {self.promotion}"
+        self._show_cache = text
         return text
 
     def buy(self, quantity: int) -> float:
@@ -239,6 +266,8 @@ class NonStockedProduct(Product):
 
 
 class LimitedProduct(Product):
+    __slots__ = ("_maximum",)
+
     def __init__(
         self, name: str, price: float, quantity: int, maximum: int
     ) -> None:
@@ -253,12 +282,15 @@ class LimitedProduct(Product):
             str: Description of the product.
         """
 
+        if self._show_cache is not None:
+            return self._show_cache
         text = (
             f"{self.name}, Price: {self.price}, Quantity: {self._quantity}"
             + f", Maximum: {self._maximum}"
         )
         if isinstance(self._promotion, Promotion):
             text += f", Promotion: {self.promotion}"
+        self._show_cache = text
         return text
 
     def buy(self, quantity: int) -> float:
@@ -283,8 +315,15 @@ class LimitedProduct(Product):
             print(f"Cannot buy more than {self._maximum} {self.name}'s!")
             quantity = self._maximum
         if isinstance(self._promotion, Promotion):
-            return self._promotion.apply_promotions(self, self._maximum)
-        else:
-            self._quantity -= quantity
-            Product.total_quantity -= quantity
-            return self.price * quantity
+            return self._promotion.apply_promotions(self, quantity)
+        remaining = self._quantity - quantity
+        if remaining < 0:
+            raise ValueError(
+                f"Cannot buy more {self.name}'s than {self._quantity}"
+            )
+        self._quantity = remaining
+        self._show_cache = None
+        self._notify_quantity_change(-quantity)
+        if remaining == 0:
+            self.deactivate()
+        return self.price * quantity
@@ -10,13 +10,9 @@ Usage:
     Each promotion class has an `apply_promotions` method that takes a product
     and quantity, calculates the total price after applying the promotion,
     and reduces the product's quantity if applicable.
-
-Dependencies:
-    Requires the `products` module for product classes and inventory management.
 """
 
 from abc import ABC
-import products
 
 
 class Promotion(ABC):
@@ -44,9 +40,8 @@ class PercentDiscount(Promotion):
 
         discount_multiplier = 1 - (self.percent / 100)
         discounted_price = product.price * discount_multiplier
-        if not isinstance(product, products.NonStockedProduct):
+        if product.is_stocked:
             product.quantity -= quantity
-            products.Product.total_quantity -= quantity
         return discounted_price * quantity
 
 
@@ -62,15 +57,13 @@ class SecondHalfPrice(Promotion):
 
     def apply_promotions(self, product, quantity) -> float:
         """Applies the second-half price promotion to the product's price."""
-        total_price = 0
-        for n in range(1, quantity + 1):
-            if n % 2 == 0:
-                total_price += product.price / 2
-            else:
-                total_price += product.price
-            if not isinstance(product, products.NonStockedProduct):
-                product.quantity -= 1
-                products.Product.total_quantity -= 1
+
+        full_price_units = quantity - (quantity // 2)
+        total_price = product.price * (
+            full_price_units + 0.5 * (quantity // 2)
+        )
+        if product.is_stocked:
+            product.quantity -= quantity
         return total_price
 
 
@@ -87,13 +80,8 @@ class ThirdOneFree(Promotion):
     def apply_promotions(self, product, quantity) -> float:
         """Applies the third-one-free promotion to the product's price."""
 
-        total_price = 0
-        for n in range(1, quantity + 1):
-            if n % 3 == 0:
-                pass
-            else:
-                total_price += product.price
-            if not isinstance(product, products.NonStockedProduct):
-                product.quantity -= quantity
-                products.Product.total_quantity -= quantity
+        paid_units = quantity - (quantity // 3)
+        total_price = product.price * paid_units
+        if product.is_stocked:
+            product.quantity -= quantity
         return total_price
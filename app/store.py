@@ -5,28 +5,90 @@ Attributes:
     products (list): A list of Product objects available in the store.
 """
 
-from products import NonStockedProduct
+# kept at module level so the order loop only pays for string building
+# when an error actually occurs
+_ERR_QUANTITY = (
+    "Error while making order! Quantity larger than what exists\n"
+    "Quantity of {name}: {quantity}\n"
+    "Order cost: $0.00"
+)
+_ERR_INACTIVE = "Error while making order! Product {name} is Inactive"
 
 
 class Store:
     def __init__(self, products) -> None:
-        self.products = [*products]
+        # keyed by id() so adding and removing a product is O(1)
+        self._products = {id(product): product for product in products}
+        self._active = []
+        self._active_pos = {}
+        for product in self._products.values():
+            if product.active:
+                self._add_active(product)
+        self._total_quantity = sum(
+            product._quantity for product in self._products.values()
+        )
+        for product in self._products.values():
+            product._on_active_change.append(self._track_active_change)
+            product._on_quantity_change.append(self._track_quantity_change)
+
+    @property
+    def products(self) -> list:
+        """Returns the products in the store as a list."""
+
+        return list(self._products.values())
+
+    def _track_quantity_change(self, delta) -> None:
+        """Keeps the total stock counter in sync when a product's
+        quantity changes."""
+
+        self._total_quantity += delta
+
+    def _track_active_change(self, product) -> None:
+        """Keeps the active-product list in sync when a product
+        activates or deactivates."""
+
+        if product.active:
+            self._add_active(product)
+        else:
+            self._remove_active(product)
+
+    def _add_active(self, product) -> None:
+        """Appends a product to the active list and records its position."""
+
+        self._active_pos[id(product)] = len(self._active)
+        self._active.append(product)
+
+    def _remove_active(self, product) -> None:
+        """Removes a product from the active list in O(1) by swapping
+        the last entry into its slot."""
+
+        position = self._active_pos.pop(id(product))
+        last = self._active.pop()
+        if last is not product:
+            self._active[position] = last
+            self._active_pos[id(last)] = position
 
     def add_product(self, product) -> None:
-        self.products.append(product)
+        self._products[id(product)] = product
+        self._total_quantity += product._quantity
+        if product.active:
+            self._add_active(product)
+        product._on_active_change.append(self._track_active_change)
+        product._on_quantity_change.append(self._track_quantity_change)
 
     def remove_product(self, product) -> None:
-        self.products.remove(product)
+        del self._products[id(product)]
+        self._total_quantity -= product._quantity
+        if product.active:
+            self._remove_active(product)
+        product._on_active_change.remove(self._track_active_change)
+        product._on_quantity_change.remove(self._track_quantity_change)
 
     def get_total_quantity(self) -> int:
-        return len(self.products)
+        return self._total_quantity
 
     def get_all_products(self) -> list:
-        active_products = []
-        for product in self.products:
-            if product.is_active():
-                active_products.append(product)
-        return active_products
+        return self._active[:]
 
     def order(self, shopping_list: list[tuple]) -> str:
         """Get total price of ordered items from shopping_list
@@ -38,26 +100,27 @@ class Store:
         Returns:
             Total price of all items
         """
-        total_price = 0
+        # validate every line first so a bad line late in the list cannot
+        # leave the order half applied; requested quantities are summed per
+        # product so duplicate lines count against the same stock
+        requested = {}
+        for product, quantity in shopping_list:
+            if product.is_stocked:
+                # one slot read instead of two property calls per line
+                in_stock = product._quantity
+                key = id(product)
+                requested[key] = requested.get(key, 0) + quantity
+                if requested[key] > in_stock:
+                    return _ERR_QUANTITY.format(
+                        name=product.name, quantity=in_stock
+                    )
+            if not product.active:
+                return _ERR_INACTIVE.format(name=product.name)
 
+        # accumulate in integer cents so long orders cannot drift
+        # through repeated float additions
+        total_cents = 0
         for product, quantity in shopping_list:
-            if quantity > product.quantity and not isinstance(
-                product, NonStockedProduct
-            ):
-                message = (
-                    "Error while making order! "
-                    + "Quantity larger than what exists\n"
-                    + f"Quantity of {product.name}: {product.quantity}\n"
-                    + f"Order cost: ${total_price:.2f}"
-                )
-                return message
-            elif not product.active:
-                message = (
-                    "Error while making order! "
-                    + f"Product {product.name} is Inactive"
-                )
-                return message
-            else:
-                total_price += product.buy(quantity)
-
-        return f"Order cost: ${total_price:.2f}"
+            total_cents += round(product.buy(quantity) * 100)
+
+        return f"Order cost: ${total_cents / 100:.2f}"
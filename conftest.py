@@ -0,0 +1,32 @@
+"""Pytest configuration for running the test suite from the repo root.
+
+The modules in ``app`` import each other with flat imports
+(``from promotions import Promotion``) so they can be run directly with
+``python app/main.py``, while the tests import them as ``app.products`` etc.
+Put ``app`` on ``sys.path``, import the flat modules once in their natural
+order, and alias them under the ``app`` namespace so both import styles
+resolve to the same module objects.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent / "app"
+sys.path.insert(0, str(APP_DIR))
+
+import fast_pricing  # noqa: E402
+import products  # noqa: E402
+import promotions  # noqa: E402
+import store  # noqa: E402
+
+app = types.ModuleType("app")
+app.fast_pricing = fast_pricing
+app.products = products
+app.promotions = promotions
+app.store = store
+sys.modules["app"] = app
+sys.modules["app.fast_pricing"] = fast_pricing
+sys.modules["app.products"] = products
+sys.modules["app.promotions"] = promotions
+sys.modules["app.store"] = store
@@ -0,0 +1,118 @@
+import pytest
+from app.fast_pricing import (
+    PROMO_NONE,
+    PROMO_PERCENT_DISCOUNT,
+    PROMO_SECOND_HALF_PRICE,
+    PROMO_THIRD_ONE_FREE,
+    order_batch,
+    price_batch,
+)
+from app.products import NonStockedProduct, Product
+from app.promotions import PercentDiscount, SecondHalfPrice, ThirdOneFree
+from app.store import Store
+
+
+# price_batch
+@pytest.mark.parametrize("quantity", [1, 2, 3, 7, 100])
+def test_price_batch_matches_second_half_price(quantity):
+    """Test that the kernel prices a line like SecondHalfPrice"""
+    product = Product("Google Pixel 7", price=500, quantity=1000)
+    product.set_promotion(SecondHalfPrice("Second Half price!"))
+    expected = product.buy(quantity)
+    total = price_batch([500], [quantity], [PROMO_SECOND_HALF_PRICE], [0])
+    assert total == expected, "kernel disagrees with SecondHalfPrice"
+
+
+@pytest.mark.parametrize("quantity", [1, 2, 3, 4, 99])
+def test_price_batch_matches_third_one_free(quantity):
+    """Test that the kernel prices a line like ThirdOneFree"""
+    product = Product("Windows License", price=125, quantity=1000)
+    product.set_promotion(ThirdOneFree("Third One Free!"))
+    expected = product.buy(quantity)
+    total = price_batch([125], [quantity], [PROMO_THIRD_ONE_FREE], [0])
+    assert total == expected, "kernel disagrees with ThirdOneFree"
+
+
+@pytest.mark.parametrize("quantity", [1, 2, 50])
+def test_price_batch_matches_percent_discount(quantity):
+    """Test that the kernel prices a line like PercentDiscount"""
+    product = Product("Shipping", price=10, quantity=1000)
+    product.set_promotion(PercentDiscount("30% off!", percent=30))
+    expected = product.buy(quantity)
+    total = price_batch([10], [quantity], [PROMO_PERCENT_DISCOUNT], [30])
+    assert total == expected, "kernel disagrees with PercentDiscount"
+
+
+@pytest.mark.parametrize("quantity", [1, 2, 50])
+def test_price_batch_matches_plain_buy(quantity):
+    """Test that the kernel prices an unpromoted line like Product.buy"""
+    product = Product("MacBook Air M2", price=1450, quantity=1000)
+    expected = product.buy(quantity)
+    total = price_batch([1450], [quantity], [PROMO_NONE], [0])
+    assert total == expected, "kernel disagrees with Product.buy"
+
+
+def test_price_batch_sums_mixed_lines():
+    """Test that a mixed batch equals the sum of its single-line prices"""
+    prices = [500, 125, 10, 1450]
+    quantities = [3, 4, 2, 1]
+    codes = [
+        PROMO_SECOND_HALF_PRICE,
+        PROMO_THIRD_ONE_FREE,
+        PROMO_PERCENT_DISCOUNT,
+        PROMO_NONE,
+    ]
+    percents = [0, 0, 30, 0]
+    expected = sum(
+        price_batch([p], [q], [c], [pct])
+        for p, q, c, pct in zip(prices, quantities, codes, percents)
+    )
+    assert price_batch(prices, quantities, codes, percents) == expected
+
+
+# ----------------------------------------------------------------------------
+
+
+# order_batch
+def test_order_batch_flags_same_line_as_store_order():
+    """Test that the kernel rejects the same over-ordered line as Store.order"""
+    first = Product("MacBook Air M2", price=1450, quantity=100)
+    second = Product("Google Pixel 7", price=500, quantity=5)
+    store = Store([first, second])
+
+    total, bad_line = order_batch(
+        [1450, 500], [100, 5], [2, 9], [PROMO_NONE, PROMO_NONE], [0, 0]
+    )
+    assert (total, bad_line) == (-1.0, 1), "kernel flagged the wrong line"
+
+    message = store.order([(first, 2), (second, 9)])
+    assert message.startswith("Error while making order!")
+    assert second.name in message, "store flagged a different product"
+    assert first.quantity == 100, "store applied lines of a rejected order"
+
+
+def test_order_batch_skips_stock_check_for_non_stocked_lines():
+    """Test that a negative stock value marks a line as non-stocked"""
+    total, bad_line = order_batch([125], [-1], [50], [PROMO_NONE], [0])
+    assert (total, bad_line) == (125 * 50, -1)
+
+
+def test_order_batch_total_matches_store_order():
+    """Test that a valid batch totals the same as Store.order"""
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    pixel.set_promotion(SecondHalfPrice("Second Half price!"))
+    license_ = NonStockedProduct("Windows License", price=125)
+    license_.set_promotion(ThirdOneFree("Third One Free!"))
+    earbuds = Product("Bose QuietComfort Earbuds", price=250, quantity=500)
+    store = Store([pixel, license_, earbuds])
+
+    total, bad_line = order_batch(
+        [500, 125, 250],
+        [250, -1, 500],
+        [3, 4, 2],
+        [PROMO_SECOND_HALF_PRICE, PROMO_THIRD_ONE_FREE, PROMO_NONE],
+        [0, 0, 0],
+    )
+    assert bad_line == -1
+    message = store.order([(pixel, 3), (license_, 4), (earbuds, 2)])
+    assert message == f"Order cost: ${total:.2f}"
@@ -30,16 +30,16 @@ def test_product_with_negative_price():
     assert str(error.value) == "Price must be 0 or positive!"
 
 
-def test_price_type():
+@pytest.mark.parametrize(
+    "argument", ["ten", "", None, True, [1, "", "Hello"], False, [], {}]
+)
+def test_price_type(argument):
     """Test that a wrong price types raise a TypeError"""
-    price_arguments = ["ten", "", None, True, [1, "", "Hello"], False, [], {}]
-
-    for argument in price_arguments:
-        with pytest.raises(TypeError) as error:
-            Product("MacBook Air M2", price=argument, quantity=100)
-        assert (
-            str(error.value) == "Price must be an integer or a float!"
-        ), f"Failed with type:'{type(argument)}'"
+    with pytest.raises(TypeError) as error:
+        Product("MacBook Air M2", price=argument, quantity=100)
+    assert (
+        str(error.value) == "Price must be an integer or a float!"
+    ), f"Failed with type:'{type(argument)}'"
 
 
 def test_quantity_update():
@@ -83,14 +83,13 @@ def test_non_stocked_product_instantiation():
     assert product.is_active(), "product is not active"
 
 
-def test_quantity_not_zero():
+@pytest.mark.parametrize("quantity", [1, 12, -11, -1])
+def test_quantity_not_zero(quantity):
     """Test that quantity remains zero for NonStockedProduct instances"""
     product = NonStockedProduct("Windows License", price=125)
-    quantities = [1, 12, -11, -1]
-    for quantity in quantities:
-        with pytest.raises(ValueError) as error:
-            product.quantity = 10
-        assert str(error.value) == "Non stocked products have no quantity"
+    with pytest.raises(ValueError) as error:
+        product.quantity = quantity
+    assert str(error.value) == "Non stocked products have no quantity"
 
     assert product.quantity == 0, "quantity is not set to zero"
 